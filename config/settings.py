@@ -1,48 +1,134 @@
+import functools
+import hashlib
+import os
 import sys
+import tempfile
 from pathlib import Path
-from pydantic_settings import BaseSettings
-from pydantic import ConfigDict, BaseModel
+import orjson
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import BaseModel, Field
 from typing_extensions import List, Dict
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 
 
-def load_yaml_config(file_path: str) -> dict:
+CONFIG_CACHE_VERSION = 1
+
+
+def _parse_yaml(data: bytes) -> dict:
     import yaml
 
-    with open(file_path, 'r') as file:
-        return yaml.safe_load(file)
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    return yaml.load(data, Loader=Loader)
+
+
+def load_yaml_config(file_path: str) -> dict:
+    """Load a YAML config, reusing a JSON sidecar when the source is unchanged."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # Config files are small, so a single read pulls in the whole file.
+        data = os.read(fd, stat.st_size)
+    finally:
+        os.close(fd)
+    mtime_ns = stat.st_mtime_ns
+
+    cache_path = f"{file_path}.cache.json"
+    cache_key = [CONFIG_CACHE_VERSION, mtime_ns, hashlib.sha256(data).hexdigest()]
+
+    try:
+        with open(cache_path, 'rb') as cache:
+            cached = orjson.loads(cache.read())
+        if cached['key'] == cache_key:
+            return cached['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    config = _parse_yaml(data)
+
+    # Only cache configs that survive JSON unchanged; YAML dates and .nan/.inf do not.
+    try:
+        blob = orjson.dumps({'key': cache_key, 'config': config})
+    except TypeError:
+        return config
+    if orjson.loads(blob)['config'] != config:
+        return config
+
+    # Write to a temp file and rename so concurrent workers never read a partial cache.
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or '.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(blob)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return config
     
 
-config_yaml = load_yaml_config('config/tool.yaml')
+CONFIG_PATH = 'config/tool.yaml'
+
+
+@functools.cache
+def get_config_yaml() -> dict:
+    return load_yaml_config(CONFIG_PATH)
+
+
+def _from_yaml(section: str, key: str, *default):
+    """Build a default_factory that reads ``section.key`` from tool.yaml on first use."""
+    def factory():
+        if default:
+            return get_config_yaml()[section].get(key, default[0])
+        return get_config_yaml()[section][key]
+    return factory
+
 
 class Settings(BaseSettings):
-    model_arn: str = config_yaml['bedrock']['model_arn']
-    provider: str = config_yaml['bedrock']['provider']
-    model_id: str = config_yaml['bedrock']['model_id']
-    region: str = config_yaml['bedrock']['region']
-    runtime: str = config_yaml['bedrock']['runtime']
-    endpoint_url: str = config_yaml['bedrock'].get('endpoint_url', '')
-    top_p: float = config_yaml['bedrock'].get('top_p', 1.0)
-    frequency_penalty: float = config_yaml['bedrock'].get('frequency_penalty', 0.0)
-    presence_penalty: float = config_yaml['bedrock'].get('presence_penalty', 0.0)
-    aws_access_key_id: str = config_yaml['bedrock'].get('aws_access_key_id', '')
-    aws_secret_access_key: str = config_yaml['bedrock'].get('aws_secret_access_key', '')
-    aws_session_token: str = config_yaml['bedrock'].get('aws_session_token', '')
-    deepgram_api_key: str = config_yaml['deepgram'].get('deepgram_api_key', '')
-    daily_api_key: str = config_yaml['daily'].get('daily_api_key', '')
-    daily_room_name: str = config_yaml['daily'].get('daily_room_name', '')
-    daily_url: str = config_yaml['daily'].get('daily_room_url', '')
+    model_arn: str = Field(default_factory=_from_yaml('bedrock', 'model_arn'))
+    provider: str = Field(default_factory=_from_yaml('bedrock', 'provider'))
+    model_id: str = Field(default_factory=_from_yaml('bedrock', 'model_id'))
+    region: str = Field(default_factory=_from_yaml('bedrock', 'region'))
+    runtime: str = Field(default_factory=_from_yaml('bedrock', 'runtime'))
+    endpoint_url: str = Field(default_factory=_from_yaml('bedrock', 'endpoint_url', ''))
+    top_p: float = Field(default_factory=_from_yaml('bedrock', 'top_p', 1.0))
+    frequency_penalty: float = Field(default_factory=_from_yaml('bedrock', 'frequency_penalty', 0.0))
+    presence_penalty: float = Field(default_factory=_from_yaml('bedrock', 'presence_penalty', 0.0))
+    aws_access_key_id: str = Field(default_factory=_from_yaml('bedrock', 'aws_access_key_id', ''))
+    aws_secret_access_key: str = Field(default_factory=_from_yaml('bedrock', 'aws_secret_access_key', ''))
+    aws_session_token: str = Field(default_factory=_from_yaml('bedrock', 'aws_session_token', ''))
+    deepgram_api_key: str = Field(default_factory=_from_yaml('deepgram', 'deepgram_api_key', ''))
+    daily_api_key: str = Field(default_factory=_from_yaml('daily', 'daily_api_key', ''))
+    daily_room_name: str = Field(default_factory=_from_yaml('daily', 'daily_room_name', ''))
+    daily_url: str = Field(default_factory=_from_yaml('daily', 'daily_room_url', ''))
     
-    model_config = ConfigDict(
+    model_config = SettingsConfigDict(
         env_prefix='BEDROCK_',
         env_file='.env',
         env_file_encoding='utf-8',
         extra='ignore'
-    )#type: ignore
-    
-settings = Settings()
+    )
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """Build the settings on first use so importing this module does no I/O."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Keep ``from config.settings import settings`` working for existing callers.
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
@@ -1,3 +1,4 @@
+import os
 from controller.route.app import router as app_router
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,7 +19,17 @@ app.add_middleware(
 
 def main():
     import uvicorn
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+
+    development = os.getenv("ENVIRONMENT", "development") == "development"
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=development,
+        workers=None if development else int(os.getenv("WORKERS", "1")),
+    )
     
     
     
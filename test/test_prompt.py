@@ -0,0 +1,24 @@
+from workflow.prompt import prompt_with_context
+
+
+def test_prompt_with_context_renders_json_skeleton():
+    prompt = prompt_with_context({})
+
+    assert prompt["role"] == "system"
+    assert '"past_medical_history": ""' in prompt["content"]
+    assert "{}" in prompt["content"]
+
+
+def test_prompt_with_context_is_stable_across_key_order():
+    first = prompt_with_context({"name": "Jane", "age": 40})
+    second = prompt_with_context({"age": 40, "name": "Jane"})
+
+    assert '"age":40,"name":"Jane"' in first["content"]
+    assert first == second
+    assert first is not second
+
+
+def test_prompt_with_context_handles_integers_beyond_64_bits():
+    prompt = prompt_with_context({"mrn": 2**64, "name": "Jane"})
+
+    assert f'"mrn":{2**64},"name":"Jane"' in prompt["content"]
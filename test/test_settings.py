@@ -0,0 +1,107 @@
+import datetime
+import math
+import os
+
+import pytest
+
+from config import settings
+
+
+CONFIG = "bedrock:\n  model_id: test-model\n  top_p: 0.9\n"
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "tool.yaml"
+    path.write_text(CONFIG)
+    return path
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    parse_yaml = settings._parse_yaml
+
+    def tracking_parse(data):
+        calls.append(data)
+        return parse_yaml(data)
+
+    monkeypatch.setattr(settings, "_parse_yaml", tracking_parse)
+    return calls
+
+
+def sidecar(path):
+    return path.with_name(path.name + ".cache.json")
+
+
+def test_miss_writes_sidecar_and_hit_skips_parse(config_file, parse_calls):
+    first = settings.load_yaml_config(str(config_file))
+    assert sidecar(config_file).exists()
+
+    second = settings.load_yaml_config(str(config_file))
+
+    assert len(parse_calls) == 1
+    assert first == second == {"bedrock": {"model_id": "test-model", "top_p": 0.9}}
+
+
+def test_content_change_invalidates_cache(config_file, parse_calls):
+    settings.load_yaml_config(str(config_file))
+    config_file.write_text(CONFIG.replace("test-model", "other-model"))
+
+    config = settings.load_yaml_config(str(config_file))
+
+    assert len(parse_calls) == 2
+    assert config["bedrock"]["model_id"] == "other-model"
+
+
+def test_mtime_change_invalidates_cache(config_file, parse_calls):
+    settings.load_yaml_config(str(config_file))
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    settings.load_yaml_config(str(config_file))
+
+    assert len(parse_calls) == 2
+
+
+def test_version_bump_invalidates_cache(config_file, parse_calls, monkeypatch):
+    settings.load_yaml_config(str(config_file))
+    monkeypatch.setattr(settings, "CONFIG_CACHE_VERSION", settings.CONFIG_CACHE_VERSION + 1)
+
+    settings.load_yaml_config(str(config_file))
+
+    assert len(parse_calls) == 2
+
+
+def test_corrupt_sidecar_falls_back_to_parse(config_file, parse_calls):
+    sidecar(config_file).write_bytes(b"not json")
+
+    config = settings.load_yaml_config(str(config_file))
+
+    assert len(parse_calls) == 1
+    assert config["bedrock"]["model_id"] == "test-model"
+
+
+def test_unwritable_directory_still_returns_config(config_file, monkeypatch):
+    def refuse(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    monkeypatch.setattr(settings.tempfile, "mkstemp", refuse)
+
+    config = settings.load_yaml_config(str(config_file))
+
+    assert config["bedrock"]["model_id"] == "test-model"
+    assert not sidecar(config_file).exists()
+
+
+def test_cold_and_warm_loads_match_for_non_json_values(config_file, parse_calls):
+    config_file.write_text("bedrock:\n  top_p: .nan\n  since: 2024-01-01\n")
+
+    cold = settings.load_yaml_config(str(config_file))
+    warm = settings.load_yaml_config(str(config_file))
+
+    assert not sidecar(config_file).exists()
+    assert len(parse_calls) == 2
+    for config in (cold, warm):
+        assert math.isnan(config["bedrock"]["top_p"])
+        assert config["bedrock"]["since"] == datetime.date(2024, 1, 1)
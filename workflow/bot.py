@@ -20,7 +20,7 @@ from pipecat.pipeline.runner import PipelineRunner
      
 
 
-from config.settings import settings
+from config.settings import get_settings
 from workflow.prompt import prompt_with_context
 
 load_dotenv(override=True)
@@ -32,6 +32,7 @@ logger.add("logs/bot.log", rotation="100 MB", enqueue=True)
 
 
 async def main(patient_data: dict):
+    settings = get_settings()
     transport = LocalAudioTransport(
         params=LocalAudioTransportParams(
             audio_in_enabled=True,
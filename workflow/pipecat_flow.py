@@ -7,7 +7,7 @@ from loguru import logger
 load_dotenv(override=True)
 
 sys.path.append(str(Path(__file__).parent.parent))
-from config.settings import settings
+from config.settings import get_settings
 
 logger.add("logs/pipecat_flow.log", rotation="100 MB", enqueue=True)
 
@@ -46,26 +46,46 @@ Do NOT add diagnoses or facts not explicitly stated.
 Use concise, professional medical language.
 """
 
+# Fixed parts of the SOAP user prompt; the transcript is spliced in between.
+_SOAP_PREFIX = "\n                Transcript:\n                "
+_SOAP_SUFFIX = (
+    "\n\n                Generate a SOAP note with:"
+    "\n                Subjective:"
+    "\n                Objective:"
+    "\n                Assessment:"
+    "\n                Plan:"
+    "\n                "
+)
+
 
 
 
 
 class TranscriptBuffer:
+    __slots__ = ("parts", "_cached")
+
     def __init__(self):
         self.parts = []
+        self._cached = None
 
     def add(self, text: str):
         if text and text.strip():
             self.parts.append(text.strip())
+            self._cached = None
 
     def full_text(self) -> str:
-        return " ".join(self.parts)
+        # Join once per change instead of on every call.
+        if self._cached is None:
+            self._cached = " ".join(self.parts)
+        return self._cached
 
     def clear(self):
         self.parts.clear()
+        self._cached = None
 
 
 async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
+    settings = get_settings()
     logger.info("Starting medical dictation pipeline")
 
     # STT
@@ -115,16 +135,7 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {
                     "role": "user",
-                    "content": f"""
-                Transcript:
-                {transcript}
-
-                Generate a SOAP note with:
-                Subjective:
-                Objective:
-                Assessment:
-                Plan:
-                """,
+                    "content": _SOAP_PREFIX + transcript + _SOAP_SUFFIX,
                 },
             ]
         )
@@ -1,30 +1,18 @@
-import sys
-import asyncio
-from pathlib import Path    
-sys.path.append(str(Path(__file__).parent.parent))
-from dotenv import load_dotenv
-from loguru import logger
-from config.settings import PatientModel
+import json
+import textwrap
 
+import orjson
 
 
-
-
-
-def prompt_with_context(patient_data: dict) -> dict:
-    """Generate a system prompt for clinical transcription with context."""
-    
-    context_prompt = {
-        "role": "system",
-        "content": (
-            f"""This is dictated by a doctor to a voice assistant to generate a clinical note based on this information. While dictating, there might be transcription errors (e.g., wrong medical terms, drug names, or procedures).
+_CONTEXT_PROMPT_TEMPLATE = textwrap.dedent("""
+          This is dictated by a doctor to a voice assistant to generate a clinical note based on this information. While dictating, there might be transcription errors (e.g., wrong medical terms, drug names, or procedures).
           Your task:
              Also Analyze the following patient data for additional context:
           {patient_data}
           1. Identify and correct any transcription mistakes in the dictation (for example, "iron olecranon" → "isotretinoin", "creatinine" → "tretinoin", "resistantectomy" → "resistant acne").
           2. Extract the clinical information and create a structured clinical note in the following JSON format:
           3. 
-          {
+          {{
             "past_medical_history": "",
             "allergies": "",
             "current_medication": "",
@@ -33,15 +21,15 @@ def prompt_with_context(patient_data: dict) -> dict:
             "examination": "",
             "assessment_and_plan": "",
             "procedure": "",
-            "icdCodes": [{
+            "icdCodes": [{{
               "Code": "",
               "Description": ""
-            }],
-            "cptCodes": [{
+            }}],
+            "cptCodes": [{{
               "Code": "",
               "Description": ""
-            }]
-          }
+            }}]
+          }}
           Rules:
           - Only include information that is explicitly stated or clearly implied in the transcript.
           - Correct transcription errors intelligently using medical context.
@@ -51,22 +39,31 @@ def prompt_with_context(patient_data: dict) -> dict:
           Strict Rule: Do not add any headings or section titles inside the content of the JSON fields. The keys in the JSON object (e.g., "past_medical_history", "history_of_present_illness", "assessment_and_plan") already act as section identifiers. The HTML content inside each field must only include the relevant information, not an extra heading or label.
           - If atleast one of the field contains relevant data, return the JSON object with all the fields (empty or filled).
           - If no relevant or sufficient medical content exists, return:
-          {
+          {{
             "error": "Insufficient or unrelated content"
-          }
+          }}
           - Format the note dynamically based on the requested style:
             - Focused → concise, essential details only.
             - Comprehensive → detailed, narrative-style documentation.
             - Categorized → structured, bullet-like content inside each field.
-          - Output must be ONLY the JSON object"""
-        )
-    }
-    return context_prompt
-
-
-
+          - Output must be ONLY the JSON object""").strip()
 
+# Split once at import so each call only splices in the patient data.
+_PREFIX, _SUFFIX = _CONTEXT_PROMPT_TEMPLATE.format(patient_data="\0").split("\0")
 
 
+def _patient_repr(patient_data: dict) -> str:
+    # Sorted keys keep the prompt byte-identical for the same record in any key order.
+    try:
+        return orjson.dumps(patient_data, option=orjson.OPT_SORT_KEYS).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects integers beyond 64 bits, which are still valid JSON.
+        return json.dumps(patient_data, sort_keys=True, separators=(",", ":"))
 
 
+def prompt_with_context(patient_data: dict) -> dict:
+    """Generate a system prompt for clinical transcription with context."""
+    return {
+        "role": "system",
+        "content": _PREFIX + _patient_repr(patient_data) + _SUFFIX,
+    }